@@ -1,8 +1,6 @@
 """AutoMatty Plugin Scripts Package"""
 import automatty_utils
 import unreal
-import os
-import sys
 import automatty_config
 
 from automatty_config import AutoMattyConfig
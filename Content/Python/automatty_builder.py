@@ -3,7 +3,7 @@ AutoMatty Material Builder - SMART SPACING VERSION
 No more hardcoded coordinates - everything auto-calculated
 """
 import unreal
-from automatty_config import AutoMattyConfig
+from automatty_config import AutoMattyConfig, format_features
 from automatty_utils import AutoMattyUtils
 
 # ========================================
@@ -190,7 +190,10 @@ MATERIAL_FUNCTIONS = {
 
 class SubstrateMaterialBuilder:
     """Smart spacing material builder"""
-    
+
+    # Fixed attribute set - no per-instance __dict__
+    __slots__ = ("config", "lib", "atools", "default_normal", "param_manager", "spacer")
+
     def __init__(self, custom_paths=None):
         self.config = AutoMattyConfig()
         if custom_paths:
@@ -235,6 +238,9 @@ class SubstrateMaterialBuilder:
             unreal.log_error("❌ Substrate is not enabled in project settings!")
             return None
         
+        # Fresh parameter layout per material - the builder itself is reused
+        self.param_manager = ParameterManager()
+        
         # Generate name and path
         name, folder = self._generate_material_name(material_type, base_name, custom_path, features)
         
@@ -253,8 +259,7 @@ class SubstrateMaterialBuilder:
         unreal.EditorAssetLibrary.save_loaded_asset(material)
         
         # Log success
-        feature_names = [k.replace('use_', '') for k, v in features.items() if v]
-        feature_text = f" ({', '.join(feature_names)})" if feature_names else ""
+        feature_text = format_features(features, " ({})")
         unreal.log(f"✅ {material_type.upper()} material '{name}'{feature_text} created")
         
         return material
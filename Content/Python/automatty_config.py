@@ -40,6 +40,13 @@ SETTINGS_CONFIG = {
     }
 }
 
+# Setting key -> text input property on the EUW
+SETTING_INPUTS = {
+    key: config["widget_property"]
+    for key, config in SETTINGS_CONFIG.items()
+    if config.get("widget_property")
+}
+
 # Button actions configuration - drives all the create_* functions
 BUTTON_ACTIONS = {
     "create_orm": {
@@ -91,17 +98,73 @@ FEATURE_CHECKBOXES = {
     "use_tex_var": "UseTexVar"
 }
 
+def get_feature_names(features):
+    """Short names of enabled feature flags ('use_nanite' -> 'nanite')"""
+    return [k.replace('use_', '') for k, v in features.items() if v]
+
+def format_features(features, template):
+    """Fill template's {} with enabled feature names - '' when nothing is on"""
+    if not any(features.values()):
+        return ""
+    return template.format(', '.join(get_feature_names(features)))
+
 # Validation patterns
+_NAME_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9_]*$')
+
 VALIDATORS = {
     "path": lambda x: x.startswith("/Game/") if x else True,
-    "name": lambda x: bool(x and re.match(r'^[a-zA-Z][a-zA-Z0-9_]*$', x)),
+    "name": lambda x: bool(x and _NAME_RE.match(x)),
     "hotkey": lambda x: len(x) == 1 and x.isalpha() if x else True
 }
 
+# Config file location - project dir is fixed for the editor session
+CONFIG_FILE = os.path.join(unreal.Paths.project_dir(), "Saved", "Config", "AutoMatty", "automatty_config.json")
+_CONFIG_DIR_ENSURED = False
+
+def _file_stamp(path):
+    """(mtime_ns, size) - catches edits a coarse float mtime can miss"""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+def _ensure_config_dir():
+    """Create the config folder once per session"""
+    global _CONFIG_DIR_ENSURED
+    if not _CONFIG_DIR_ENSURED:
+        config_dir = os.path.dirname(CONFIG_FILE)
+        if not os.path.isdir(config_dir):
+            os.makedirs(config_dir, exist_ok=True)
+        _CONFIG_DIR_ENSURED = True
+
+# Dev mode - reload action modules when their source changes (set AUTOMATTY_DEV_RELOAD=1)
+DEV_RELOAD = bool(os.environ.get("AUTOMATTY_DEV_RELOAD"))
+
+# Cached editor handles - cleared by invalidate_automatty_cache()
+_SETUP_CACHE = {"modules": {}, "widget": None, "blueprint": None, "builders": {}, "mtimes": {}}
+
+EUW_BLUEPRINT_PATH = "/AutoMatty/Blueprints/EUW_AutoMatty"
+
+def reload_if_changed(module):
+    """Dev mode: reload module only when its .py changed since the last check"""
+    import importlib
+    try:
+        mtime = os.path.getmtime(module.__file__)
+    except (AttributeError, TypeError, OSError):
+        return importlib.reload(module)
+    
+    mtimes = _SETUP_CACHE["mtimes"]
+    if module.__name__ in mtimes and mtimes[module.__name__] != mtime:
+        module = importlib.reload(module)
+    mtimes[module.__name__] = mtime
+    return module
+
+# Text-commit writes waiting for the next Slate tick - setting key -> value
+_PENDING_SETTINGS = {}
+_PENDING_FLUSH_HANDLE = None
+
 # Texture matching patterns (moved from old config)
 TEXTURE_PATTERNS = {
     "ORM": re.compile(r"(?:^|[_\W])orm(?:$|[_\W])|occlusion[-_]?roughness[-_]?metal(?:lic|ness)", re.IGNORECASE),
-    "Color": re.compile(r"(colou?r|albedo|base[-_]?color|diffuse)", re.IGNORECASE),
+    "Color": re.compile(r"(?:colou?r|albedo|base[-_]?color|diffuse)", re.IGNORECASE),
     "Normal": re.compile(r"normal", re.IGNORECASE),
     "Occlusion": re.compile(r"(?:^|[_\W])(?:ao|occlusion)(?:$|[_\W])", re.IGNORECASE),
     "Roughness": re.compile(r"roughness", re.IGNORECASE),
@@ -111,6 +174,13 @@ TEXTURE_PATTERNS = {
     "BlendMask": re.compile(r"(?:^|[_\W])(?:blend|mask|mix)(?:$|[_\W])", re.IGNORECASE),
 }
 
+def classify_texture(name):
+    """Return the first TEXTURE_PATTERNS type (dict order = priority) matching name, or None"""
+    for tex_type, pattern in TEXTURE_PATTERNS.items():
+        if pattern.search(name):
+            return tex_type
+    return None
+
 # ========================================
 # CORE CONFIG CLASS
 # ========================================
@@ -118,33 +188,45 @@ TEXTURE_PATTERNS = {
 class AutoMattyConfig:
     """Clean, dictionary-driven configuration management"""
     
+    # Parsed config file - reused until the file's (mtime_ns, size) stamp changes
+    _cache = None
+    _cache_stamp = None
+    
     @staticmethod
     def get_config_path():
         """Get config file path"""
-        proj_dir = unreal.Paths.project_dir()
-        config_dir = os.path.join(proj_dir, "Saved", "Config", "AutoMatty")
-        return os.path.join(config_dir, "automatty_config.json")
+        return CONFIG_FILE
     
     @staticmethod
     def load_config():
-        """Load entire config as dict"""
+        """Load entire config as dict (cached, re-read only when the file changes)"""
         config_path = AutoMattyConfig.get_config_path()
         try:
-            if os.path.exists(config_path):
+            stamp = _file_stamp(config_path)
+        except OSError:
+            return {}
+        
+        if AutoMattyConfig._cache is None or stamp != AutoMattyConfig._cache_stamp:
+            try:
                 with open(config_path, 'r') as f:
-                    return json.load(f)
-        except Exception as e:
-            unreal.log_warning(f"⚠️ Failed to load config: {e}")
-        return {}
+                    AutoMattyConfig._cache = json.load(f)
+                AutoMattyConfig._cache_stamp = stamp
+            except Exception as e:
+                unreal.log_warning(f"⚠️ Failed to load config: {e}")
+                return {}
+        
+        return dict(AutoMattyConfig._cache)
     
     @staticmethod
     def save_config(config_data):
-        """Save entire config dict"""
+        """Save entire config dict (write-through to the cache)"""
         config_path = AutoMattyConfig.get_config_path()
         try:
-            os.makedirs(os.path.dirname(config_path), exist_ok=True)
+            _ensure_config_dir()
             with open(config_path, 'w') as f:
                 json.dump(config_data, f, indent=2)
+            AutoMattyConfig._cache = dict(config_data)
+            AutoMattyConfig._cache_stamp = _file_stamp(config_path)
             return True
         except Exception as e:
             unreal.log_error(f"❌ Failed to save config: {e}")
@@ -153,32 +235,67 @@ class AutoMattyConfig:
     @staticmethod
     def get_setting(setting_key):
         """Get single setting with default fallback"""
+        # A queued text-commit value is newer than the file
+        if setting_key in _PENDING_SETTINGS:
+            return _PENDING_SETTINGS[setting_key]
         config = AutoMattyConfig.load_config()
         setting_config = SETTINGS_CONFIG.get(setting_key, {})
         return config.get(setting_key, setting_config.get("default", ""))
     
     @staticmethod
-    def set_setting(setting_key, value):
-        """Set single setting"""
+    def get_settings():
+        """Get every setting from one config read - {key: value}"""
+        config = AutoMattyConfig.load_config()
+        settings = {
+            key: config.get(key, setting_config.get("default", ""))
+            for key, setting_config in SETTINGS_CONFIG.items()
+        }
+        settings.update(_PENDING_SETTINGS)
+        return settings
+    
+    @staticmethod
+    def validate_setting(setting_key, value):
+        """Check a setting key/value against SETTINGS_CONFIG, logging any problem"""
         if setting_key not in SETTINGS_CONFIG:
             unreal.log_error(f"❌ Unknown setting: {setting_key}")
             return False
         
-        # Validate
-        setting_config = SETTINGS_CONFIG[setting_key]
-        validator = VALIDATORS.get(setting_config.get("validation"))
+        validator = VALIDATORS.get(SETTINGS_CONFIG[setting_key].get("validation"))
         if validator and not validator(value):
             unreal.log_error(f"❌ Invalid {setting_key}: {value}")
             return False
+        return True
+    
+    @staticmethod
+    def set_setting(setting_key, value):
+        """Set single setting"""
+        return AutoMattyConfig.set_settings({setting_key: value})
+    
+    @staticmethod
+    def set_settings(settings):
+        """Set several settings with a single config write"""
+        valid = {k: v for k, v in settings.items() if AutoMattyConfig.validate_setting(k, v)}
+        if not valid:
+            return False
         
-        # Save
+        # A direct write is newer than anything still queued for these keys
+        for setting_key in valid:
+            _PENDING_SETTINGS.pop(setting_key, None)
+        
+        # Skip the write entirely when every value is already stored
         config = AutoMattyConfig.load_config()
-        config[setting_key] = value
+        valid = {k: v for k, v in valid.items() if config.get(k) != v}
+        if not valid:
+            return True
+        
+        # Save
+        config.update(valid)
         success = AutoMattyConfig.save_config(config)
         
         if success:
-            desc = setting_config.get("description", setting_key)
-            unreal.log(f"✅ {desc}: {value}")
+            for setting_key, value in valid.items():
+                desc = SETTINGS_CONFIG[setting_key].get("description", setting_key)
+                unreal.log(f"✅ {desc}: {value}")
         
         return success
     
@@ -211,6 +328,7 @@ AutoMattyConfig.set_custom_material_prefix = lambda x: AutoMattyConfig.set_setti
 
 # Export texture patterns for other modules
 AutoMattyConfig.TEXTURE_PATTERNS = TEXTURE_PATTERNS
+AutoMattyConfig.classify_texture = staticmethod(classify_texture)
 
 # ========================================
 # WIDGET INTERACTION
@@ -219,30 +337,74 @@ AutoMattyConfig.TEXTURE_PATTERNS = TEXTURE_PATTERNS
 class WidgetManager:
     """Centralized widget interaction"""
     
+    @staticmethod
+    def get_blueprint():
+        """EUW blueprint asset - loaded once, reloaded only if it goes invalid"""
+        blueprint = _SETUP_CACHE["blueprint"]
+        if blueprint is None or not unreal.SystemLibrary.is_valid(blueprint):
+            blueprint = unreal.EditorAssetLibrary.load_asset(EUW_BLUEPRINT_PATH)
+            _SETUP_CACHE["blueprint"] = blueprint
+        return blueprint
+    
     @staticmethod
     def get_widget():
-        """Get widget instance"""
+        """Get widget instance (cached by object path until the widget goes away)"""
+        widget_path = _SETUP_CACHE["widget"]
+        if widget_path:
+            widget = unreal.find_object(None, widget_path)
+            if widget and unreal.SystemLibrary.is_valid(widget):
+                return widget
+        
         try:
             subsystem = unreal.get_editor_subsystem(unreal.EditorUtilitySubsystem)
-            blueprint = unreal.EditorAssetLibrary.load_asset("/AutoMatty/Blueprints/EUW_AutoMatty")
-            return subsystem.find_utility_widget_from_blueprint(blueprint) if blueprint else None
-        except:
-            return None
+            blueprint = WidgetManager.get_blueprint()
+            widget = subsystem.find_utility_widget_from_blueprint(blueprint) if blueprint else None
+        except Exception as e:
+            unreal.log_warning(f"⚠️ Widget lookup failed: {e}")
+            widget = None
+        
+        WidgetManager.remember_widget(widget)
+        return widget
+    
+    @staticmethod
+    def remember_widget(widget):
+        """Cache a freshly spawned widget so callbacks skip the blueprint lookup"""
+        # Path only - a Python reference would keep the closed EUW alive past GC
+        _SETUP_CACHE["widget"] = widget.get_path_name() if widget else None
+    
+    @staticmethod
+    def invalidate_widget_cache():
+        """Forget the cached widget - next get_widget() resolves it again"""
+        _SETUP_CACHE["widget"] = None
+    
+    @staticmethod
+    def snapshot(widget, property_names):
+        """Read several widget properties in one pass - {name: value or None}"""
+        get_property = widget.get_editor_property
+        values = {}
+        for name in property_names:
+            try:
+                values[name] = get_property(name)
+            except Exception:
+                values[name] = None
+        return values
     
     @staticmethod
     def get_checkboxes():
         """Get all checkbox states"""
+        # Everything defaults to off - failures below just leave the default
+        checkboxes = dict.fromkeys(FEATURE_CHECKBOXES, False)
         widget = WidgetManager.get_widget()
         if not widget:
-            return {key: False for key in FEATURE_CHECKBOXES.keys()}
+            return checkboxes
         
-        checkboxes = {}
+        inputs = WidgetManager.snapshot(widget, FEATURE_CHECKBOXES.values())
         for feature_key, widget_property in FEATURE_CHECKBOXES.items():
+            checkbox = inputs[widget_property]
             try:
-                checkbox = widget.get_editor_property(widget_property)
-                checkboxes[feature_key] = checkbox.is_checked() if checkbox else False
-            except:
-                checkboxes[feature_key] = False
+                checkboxes[feature_key] = bool(checkbox and checkbox.is_checked())
+            except Exception as e:
+                unreal.log_warning(f"⚠️ Failed to read {widget_property}: {e}")
         
         return checkboxes
     
@@ -254,16 +416,16 @@ class WidgetManager:
             unreal.log_warning("⚠️ No widget found")
             return False
         
+        inputs = WidgetManager.snapshot(widget, SETTING_INPUTS.values())
+        settings = AutoMattyConfig.get_settings()
         success_count = 0
-        for setting_key, config in SETTINGS_CONFIG.items():
+        for setting_key, widget_property in SETTING_INPUTS.items():
+            input_widget = inputs[widget_property]
+            if not input_widget:
+                continue
             try:
-                widget_property = config.get("widget_property")
-                if widget_property:
-                    input_widget = widget.get_editor_property(widget_property)
-                    if input_widget:
-                        value = AutoMattyConfig.get_setting(setting_key)
-                        input_widget.set_text(str(value))
-                        success_count += 1
+                input_widget.set_text(str(settings[setting_key]))
+                success_count += 1
             except Exception as e:
                 unreal.log_warning(f"⚠️ Failed to load {setting_key}: {e}")
         
@@ -278,22 +440,27 @@ class WidgetManager:
             unreal.log_error("❌ No widget found")
             return False
         
+        inputs = WidgetManager.snapshot(widget, SETTING_INPUTS.values())
+        current = AutoMattyConfig.get_settings()
         success_count = 0
-        for setting_key, config in SETTINGS_CONFIG.items():
+        unchanged_count = 0
+        for setting_key, widget_property in SETTING_INPUTS.items():
+            input_widget = inputs[widget_property]
+            if not input_widget:
+                continue
             try:
-                widget_property = config.get("widget_property")
-                if widget_property:
-                    input_widget = widget.get_editor_property(widget_property)
-                    if input_widget:
-                        value = str(input_widget.get_text()).strip()
-                        if value:  # Only save non-empty values
-                            if AutoMattyConfig.set_setting(setting_key, value):
-                                success_count += 1
+                value = str(input_widget.get_text()).strip()
+                if not value:  # Only save non-empty values
+                    continue
+                if value == current[setting_key]:
+                    unchanged_count += 1
+                elif AutoMattyConfig.set_setting(setting_key, value):
+                    success_count += 1
             except Exception as e:
                 unreal.log_warning(f"⚠️ Failed to save {setting_key}: {e}")
         
-        unreal.log(f"💾 Saved {success_count} settings")
-        return success_count > 0
+        unreal.log(f"💾 Saved {success_count} settings ({unchanged_count} unchanged)")
+        return success_count + unchanged_count > 0
 
 # ========================================
 # BUTTON ACTION SYSTEM  
@@ -302,6 +469,28 @@ class WidgetManager:
 class ButtonActionManager:
     """Unified button action system"""
     
+    @staticmethod
+    def get_module(module_name):
+        """Import action module once, reload only in dev mode"""
+        module = _SETUP_CACHE["modules"].get(module_name)
+        if module is None:
+            import importlib
+            module = importlib.import_module(module_name)
+        if DEV_RELOAD:
+            module = reload_if_changed(module)
+        _SETUP_CACHE["modules"][module_name] = module
+        return module
+    
+    @staticmethod
+    def get_builder(module, class_name):
+        """Reuse one builder per class - rebuilt when a dev reload swaps the class"""
+        builder_class = getattr(module, class_name)
+        builder = _SETUP_CACHE["builders"].get(class_name)
+        if type(builder) is not builder_class:
+            builder = builder_class()
+            _SETUP_CACHE["builders"][class_name] = builder
+        return builder
+    
     @staticmethod
     def execute_action(action_key):
         """Execute any button action by key"""
@@ -313,11 +502,8 @@ class ButtonActionManager:
         unreal.log(action_config["description"])
         
         try:
-            # Import and reload module
-            import importlib
-            module_name = action_config["module"]
-            module = importlib.import_module(module_name)
-            importlib.reload(module)
+            # Import module (cached across clicks)
+            module = ButtonActionManager.get_module(action_config["module"])
             
             # Get features if needed
             kwargs = {}
@@ -328,8 +514,7 @@ class ButtonActionManager:
             result = None
             if "class" in action_config:
                 # Class method approach
-                builder_class = getattr(module, action_config["class"])
-                builder = builder_class()
+                builder = ButtonActionManager.get_builder(module, action_config["class"])
                 method = getattr(builder, action_config["method"])
                 result = method(**kwargs)
             else:
@@ -337,18 +522,11 @@ class ButtonActionManager:
                 func = getattr(module, action_config["function"])
                 result = func(**kwargs)
             
-            # Log success
+            # Log success (name and features in one line)
             if result:
-                success_msg = action_config["success_msg"]
-                if hasattr(result, 'get_name'):
-                    success_msg += f": {result.get_name()}"
-                unreal.log(success_msg)
-                
-                # Log features if applicable
-                if kwargs:
-                    features = [k.replace('use_', '') for k, v in kwargs.items() if v]
-                    if features:
-                        unreal.log(f"💡 Features: {', '.join(features)}")
+                name_text = f": {result.get_name()}" if hasattr(result, 'get_name') else ""
+                feature_text = format_features(kwargs, " | 💡 Features: {}")
+                unreal.log(f"{action_config['success_msg']}{name_text}{feature_text}")
             else:
                 unreal.log("⚠️ Action completed but no result returned")
             
@@ -362,17 +540,32 @@ class ButtonActionManager:
 # MATERIAL EDITOR INTEGRATION
 # ========================================
 
+# Set once unreal_qt has imported - later calls skip the import machinery
+_QT_READY = False
+# Set after the first pip attempt - a failed install is not re-run on every click
+_QT_INSTALL_ATTEMPTED = False
+
 def ensure_unreal_qt():
     """Auto-install unreal_qt if missing with enhanced logging"""
+    global _QT_READY, _QT_INSTALL_ATTEMPTED
+    if _QT_READY:
+        return True
+    
     try:
         import unreal_qt
         unreal.log("✅ unreal-qt already available")
+        _QT_READY = True
         return True
     except ImportError:
+        if _QT_INSTALL_ATTEMPTED:
+            unreal.log_error("❌ unreal-qt still missing - install was already attempted this session")
+            unreal.log_error("💡 Restart Unreal Editor or install manually: pip install unreal-qt")
+            return False
+        _QT_INSTALL_ATTEMPTED = True
+        
         unreal.log("📦 unreal-qt not found, installing...")
         
         import subprocess
-        import sys
         python_exe = sys.executable
         
         # Show what Python we're using
@@ -394,6 +587,7 @@ def ensure_unreal_qt():
             try:
                 import unreal_qt
                 unreal.log("🎉 unreal-qt import successful after install!")
+                _QT_READY = True
                 return True
             except ImportError as import_err:
                 unreal.log_error(f"❌ Install succeeded but import still fails: {import_err}")
@@ -423,8 +617,8 @@ def show_material_editor():
         unreal_qt.setup()
 
         import automatty_material_instance_editor
-        import importlib
-        importlib.reload(automatty_material_instance_editor)
+        if DEV_RELOAD:
+            reload_if_changed(automatty_material_instance_editor)
 
         automatty_material_instance_editor.show_editor_for_selection()
         return True
@@ -437,9 +631,9 @@ def open_main_widget():
     """Open the AutoMatty main widget - simple wrapper for C++ toolbar"""
     try:
         subsystem = unreal.get_editor_subsystem(unreal.EditorUtilitySubsystem)
-        blueprint = unreal.EditorAssetLibrary.load_asset("/AutoMatty/Blueprints/EUW_AutoMatty")
+        blueprint = WidgetManager.get_blueprint()
         if blueprint:
-            subsystem.spawn_and_register_tab(blueprint)
+            WidgetManager.remember_widget(subsystem.spawn_and_register_tab(blueprint))
             unreal.log("🎯 AutoMatty main widget opened")
             return True
         else:
@@ -459,14 +653,7 @@ class AutoMattyMainMenuScript(unreal.ToolMenuEntryScript):
     
     @unreal.ufunction(override=True) 
     def execute(self, context):
-        try:
-            subsystem = unreal.get_editor_subsystem(unreal.EditorUtilitySubsystem)
-            blueprint = unreal.EditorAssetLibrary.load_asset("/AutoMatty/Blueprints/EUW_AutoMatty")
-            if blueprint:
-                subsystem.spawn_and_register_tab(blueprint)
-                unreal.log("🎯 AutoMatty main widget opened")
-        except Exception as e:
-            unreal.log_error(f"❌ Failed: {e}")
+        open_main_widget()
 
 @unreal.uclass()
 class AutoMattyMaterialEditorScript(unreal.ToolMenuEntryScript):
@@ -524,9 +711,9 @@ class AutoMattySettingsScript(unreal.ToolMenuEntryScript):
     def execute(self, context):
         try:
             subsystem = unreal.get_editor_subsystem(unreal.EditorUtilitySubsystem)
-            blueprint = unreal.EditorAssetLibrary.load_asset("/AutoMatty/Blueprints/EUW_AutoMatty")
+            blueprint = WidgetManager.get_blueprint()
             if blueprint:
-                widget = subsystem.spawn_and_register_tab(blueprint)
+                WidgetManager.remember_widget(subsystem.spawn_and_register_tab(blueprint))
                 unreal.log("🎯 AutoMatty settings opened")
         except Exception as e:
             unreal.log_error(f"❌ Failed: {e}")
@@ -539,6 +726,10 @@ class AutoMattyMenuManager:
     @staticmethod
     def register_main_menu():
         """Register AutoMatty as toolbar dropdown button - FIXED VERSION"""
+        # Already registered this session - skip the entry rebuild and widget refresh
+        if AutoMattyMenuManager._menu_scripts:
+            return True
+        
         try:
             menus = unreal.ToolMenus.get()
             
@@ -642,6 +833,39 @@ class AutoMattyMenuManager:
 # PUBLIC API FUNCTIONS (for widget buttons)
 # ========================================
 
+# Cache control
+def invalidate_automatty_cache():
+    """Reload cached action modules, drop the widget handle and the engine probes"""
+    import importlib
+    for module_name, module in list(_SETUP_CACHE["modules"].items()):
+        _SETUP_CACHE["modules"][module_name] = importlib.reload(module)
+    _SETUP_CACHE["builders"].clear()
+    WidgetManager.invalidate_widget_cache()
+    
+    from automatty_utils import AutoMattyUtils  # Deferred - utils imports this module
+    AutoMattyUtils.invalidate_caches()
+    unreal.log("🔄 AutoMatty cache invalidated")
+    return True
+
+def automatty_reload():
+    """Force-reload every loaded AutoMatty module - console helper for development"""
+    import importlib
+    # Don't lose queued writes (or leave the flush callback orphaned)
+    _flush_pending_settings()
+    # Config first so dependents re-import the fresh classes
+    module_order = [
+        "automatty_config", "automatty_utils", "automatty_builder",
+        "automatty_instancer", "automatty_repather", "automatty_material_instance_editor"
+    ]
+    reloaded = []
+    for module_name in module_order:
+        module = sys.modules.get(module_name)
+        if module:
+            importlib.reload(module)
+            reloaded.append(module_name)
+    unreal.log(f"🔄 Reloaded {len(reloaded)} AutoMatty modules")
+    return reloaded
+
 # Settings functions
 def load_current_settings():
     """Load settings into widget"""
@@ -661,7 +885,7 @@ def create_split_material():
     return ButtonActionManager.execute_action("create_split")
 
 def create_environment_material():
-    """Create Environment material"""  
+    """Create Environment material"""
     return ButtonActionManager.execute_action("create_environment")
 
 def create_material_instance():
@@ -673,33 +897,32 @@ def repath_material_instances():
     return ButtonActionManager.execute_action("repath_instances")
 
 # Legacy UI functions (for backward compatibility)
-def ui_get_current_material_path():
-    return AutoMattyConfig.get_setting("material_path")
-
-def ui_set_custom_material_path(path):
+def _normalize_game_path(path):
+    """Map content-browser style paths onto /Game/"""
     clean_path = path.strip()
     if clean_path.startswith("/All/Game/"):
         clean_path = clean_path.replace("/All/Game/", "/Game/", 1)
     elif not clean_path.startswith("/Game/") and clean_path:
         clean_path = f"/Game/{clean_path.lstrip('/')}"
-    
+    return clean_path
+
+def _set_path_setting(setting_key, path):
+    clean_path = _normalize_game_path(path)
     if clean_path and AutoMattyConfig.validate_and_create_path(clean_path):
-        return AutoMattyConfig.set_setting("material_path", clean_path)
-    return AutoMattyConfig.set_setting("material_path", "")
+        return AutoMattyConfig.set_setting(setting_key, clean_path)
+    return AutoMattyConfig.set_setting(setting_key, "")
+
+def ui_get_current_material_path():
+    return AutoMattyConfig.get_setting("material_path")
+
+def ui_set_custom_material_path(path):
+    return _set_path_setting("material_path", path)
 
 def ui_get_current_texture_path():
     return AutoMattyConfig.get_setting("texture_path")
 
 def ui_set_custom_texture_path(path):
-    clean_path = path.strip()
-    if clean_path.startswith("/All/Game/"):
-        clean_path = clean_path.replace("/All/Game/", "/Game/", 1) 
-    elif not clean_path.startswith("/Game/") and clean_path:
-        clean_path = f"/Game/{clean_path.lstrip('/')}"
-    
-    if clean_path and AutoMattyConfig.validate_and_create_path(clean_path):
-        return AutoMattyConfig.set_setting("texture_path", clean_path)
-    return AutoMattyConfig.set_setting("texture_path", "")
+    return _set_path_setting("texture_path", path)
 
 def ui_get_current_material_prefix():
     return AutoMattyConfig.get_setting("material_prefix")
@@ -716,94 +939,76 @@ def ui_set_hotkey(hotkey):
 # ========================================
 # DIRECT UI TEXT HANDLING
 # ========================================
-def handle_material_path_changed(text_input=None, commit_method=None):
-    """Handle material path text change directly from EUW OnTextCommitted"""
-    
-    # If no text provided, get it from the widget
-    if text_input is None:
-        widget = WidgetManager.get_widget()
-        if widget:
-            material_input = widget.get_editor_property("MaterialPathInput")
-            if material_input:
-                text_input = material_input.get_text()
-            else:
-                unreal.log_error("❌ MaterialPathInput widget not found")
-                return ""
-        else:
-            unreal.log_error("❌ Widget not found")
-            return ""
-    
-    clean_path = str(text_input).strip()
+def _flush_pending_settings(delta_time=0.0):
+    """Write every queued text-commit setting in one config save"""
+    global _PENDING_FLUSH_HANDLE
+    if _PENDING_FLUSH_HANDLE is not None:
+        unreal.unregister_slate_post_tick_callback(_PENDING_FLUSH_HANDLE)
+        _PENDING_FLUSH_HANDLE = None
     
-    if clean_path.startswith("/All/Game/"):
-        clean_path = clean_path.replace("/All/Game/", "/Game/", 1)
-    elif not clean_path.startswith("/Game/") and clean_path:
-        clean_path = f"/Game/{clean_path.lstrip('/')}"
-    
-    if clean_path and AutoMattyConfig.validate_and_create_path(clean_path):
-        AutoMattyConfig.set_setting("material_path", clean_path)
-        unreal.log(f"✅ Material path updated: {clean_path}")
-    elif clean_path:
-        unreal.log_error(f"❌ Invalid material path: {clean_path}")
+    if _PENDING_SETTINGS:
+        pending = dict(_PENDING_SETTINGS)
+        _PENDING_SETTINGS.clear()
+        AutoMattyConfig.set_settings(pending)
+
+def _queue_setting(setting_key, value):
+    """Defer a setting write to the next Slate tick so edits in one frame share a save"""
+    global _PENDING_FLUSH_HANDLE
+    if not AutoMattyConfig.validate_setting(setting_key, value):
+        return False
     
-    return clean_path
+    _PENDING_SETTINGS[setting_key] = value
+    if _PENDING_FLUSH_HANDLE is None:
+        try:
+            _PENDING_FLUSH_HANDLE = unreal.register_slate_post_tick_callback(_flush_pending_settings)
+        except Exception:
+            # No Slate (commandlet / headless) - write straight away
+            _flush_pending_settings()
+    return True
 
-def handle_texture_path_changed(text_input=None, commit_method=None):
-    """Handle texture path text change directly from EUW OnTextCommitted"""
+def _handle_text_changed(setting_key, text_input):
+    """Shared EUW OnTextCommitted handler - reads the input itself if no text is passed"""
+    widget_property = SETTING_INPUTS[setting_key]
     
     # If no text provided, get it from the widget
     if text_input is None:
         widget = WidgetManager.get_widget()
-        if widget:
-            texture_input = widget.get_editor_property("TexturePathInput")
-            if texture_input:
-                text_input = texture_input.get_text()
-            else:
-                unreal.log_error("❌ TexturePathInput widget not found")
-                return ""
-        else:
+        if not widget:
             unreal.log_error("❌ Widget not found")
             return ""
+        input_widget = widget.get_editor_property(widget_property)
+        if not input_widget:
+            unreal.log_error(f"❌ {widget_property} widget not found")
+            return ""
+        text_input = input_widget.get_text()
     
-    clean_path = str(text_input).strip()
+    label = setting_key.replace("_", " ").capitalize()
     
-    if clean_path.startswith("/All/Game/"):
-        clean_path = clean_path.replace("/All/Game/", "/Game/", 1)
-    elif not clean_path.startswith("/Game/") and clean_path:
-        clean_path = f"/Game/{clean_path.lstrip('/')}"
+    if SETTINGS_CONFIG[setting_key]["validation"] != "path":
+        clean_value = str(text_input).strip()
+        if clean_value:
+            _queue_setting(setting_key, clean_value)
+        return clean_value
     
+    clean_path = _normalize_game_path(str(text_input))
     if clean_path and AutoMattyConfig.validate_and_create_path(clean_path):
-        AutoMattyConfig.set_setting("texture_path", clean_path)
-        unreal.log(f"✅ Texture path updated: {clean_path}")
+        _queue_setting(setting_key, clean_path)
     elif clean_path:
-        unreal.log_error(f"❌ Invalid texture path: {clean_path}")
+        unreal.log_error(f"❌ Invalid {label.lower()}: {clean_path}")
     
     return clean_path
 
+def handle_material_path_changed(text_input=None, commit_method=None):
+    """Handle material path text change directly from EUW OnTextCommitted"""
+    return _handle_text_changed("material_path", text_input)
+
+def handle_texture_path_changed(text_input=None, commit_method=None):
+    """Handle texture path text change directly from EUW OnTextCommitted"""
+    return _handle_text_changed("texture_path", text_input)
+
 def handle_material_prefix_changed(text_input=None, commit_method=None):
     """Handle material prefix text change directly from EUW OnTextCommitted"""
-    
-    # If no text provided, get it from the widget
-    if text_input is None:
-        widget = WidgetManager.get_widget()
-        if widget:
-            prefix_input = widget.get_editor_property("MaterialPrefixInput")
-            if prefix_input:
-                text_input = prefix_input.get_text()
-            else:
-                unreal.log_error("❌ MaterialPrefixInput widget not found")
-                return ""
-        else:
-            unreal.log_error("❌ Widget not found")
-            return ""
-    
-    clean_prefix = str(text_input).strip()
-    
-    if clean_prefix:
-        AutoMattyConfig.set_setting("material_prefix", clean_prefix)
-        unreal.log(f"✅ Material prefix updated: {clean_prefix}")
-    
-    return clean_prefix
+    return _handle_text_changed("material_prefix", text_input)
 
 
 def force_load_ui_settings():
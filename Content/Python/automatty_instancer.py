@@ -4,7 +4,7 @@ Smart material instance creation with environment + height map + texture variati
 """
 import unreal
 from automatty_config import AutoMattyConfig
-from automatty_utils import AutoMattyUtils
+from automatty_utils import AutoMattyUtils, TextureAssetRef
 
 
 def create_material_instance():
@@ -67,16 +67,10 @@ def _import_textures():
     return textures
 
 def _get_textures_from_folder():
-    """Get textures from configured material folder"""
+    """Get textures from configured material folder (unloaded refs - only matches get loaded)"""
     material_path = AutoMattyConfig.get_custom_material_path()
     
-    asset_paths = unreal.EditorAssetLibrary.list_assets(material_path, recursive=False)
-    textures = []
-    
-    for asset_path in asset_paths:
-        asset = unreal.EditorAssetLibrary.load_asset(asset_path)
-        if isinstance(asset, unreal.Texture2D):
-            textures.append(asset)
+    textures = AutoMattyUtils.get_texture_refs_in_folder(material_path)
     
     if textures:
         unreal.log(f"📂 Found {len(textures)} textures in {material_path}")
@@ -113,6 +107,9 @@ def _create_instance(base_material, textures):
     # Match textures to parameters
     matched_textures = _match_textures(textures, has_height, is_environment, has_variation)
     
+    # Folder textures come in as registry refs - load just the matched ones
+    matched_textures = _load_matched_textures(matched_textures)
+    
     if not matched_textures:
         unreal.log_warning("⚠️ No matching textures found")
         return None
@@ -128,8 +125,9 @@ def _create_instance(base_material, textures):
     unreal.MaterialEditingLibrary.set_material_instance_parent(instance, base_material)
     unreal.log(f"🎉 Created instance: {instance.get_name()}")
     
-    # Apply textures
+    # Apply textures - one instance update for the whole batch
     applied_count = _apply_textures(instance, matched_textures)
+    unreal.MaterialEditingLibrary.update_material_instance(instance)
     
     # Save
     unreal.EditorAssetLibrary.save_asset(instance.get_path_name())
@@ -137,6 +135,18 @@ def _create_instance(base_material, textures):
     
     return instance
 
+def _load_matched_textures(matched_textures):
+    """Resolve TextureAssetRef entries to loaded textures, dropping any that fail to load"""
+    loaded = {}
+    for param_name, texture in matched_textures.items():
+        if isinstance(texture, TextureAssetRef):
+            texture = texture.load()
+            if not texture:
+                unreal.log_warning(f"⚠️ Failed to load texture for {param_name}")
+                continue
+        loaded[param_name] = texture
+    return loaded
+
 def _is_environment_material(texture_params):
     """Check if material has environment A/B parameters"""
     env_indicators = ['ColorA', 'ColorB', 'NormalA', 'NormalB', 'RoughnessA', 'RoughnessB']
@@ -144,34 +154,38 @@ def _is_environment_material(texture_params):
 
 def _match_textures(textures, include_height=False, is_environment=False, include_variation=False):
     """Smart texture matching with environment, height, and texture variation support"""
-    import re
-    
-    patterns = AutoMattyConfig.TEXTURE_PATTERNS.copy()
+    patterns = AutoMattyConfig.TEXTURE_PATTERNS
     matched = {}
+    # Lowercased names resolved once - every pass below reuses them
+    named_textures = [(texture, texture.get_name().lower()) for texture in textures]
     
     if is_environment:
         # Environment material matching
-        matched = _match_environment_textures(textures, patterns, include_variation)
+        matched = _match_environment_textures(named_textures, patterns, include_variation)
     else:
         # Standard material matching
-        for texture in textures:
-            name = texture.get_name().lower()
-            for param_type, pattern in patterns.items():
-                # Skip Height matching if not supported
-                if param_type == "Height" and not include_height:
-                    continue
-                    
-                if param_type not in matched and pattern.search(name):
-                    matched[param_type] = texture
-                    emoji = "🏔️" if param_type == "Height" else "✅"
-                    unreal.log(f"{emoji} Matched '{texture.get_name()}' → {param_type}")
-                    break
+        # Skip Height matching if not supported
+        wanted = [t for t in patterns if t != "Height" or include_height]
+        for texture, name in named_textures:
+            if len(matched) == len(wanted):
+                break  # Every slot filled - nothing left to match
+            
+            # First still-open slot whose pattern matches, in priority order
+            param_type = next(
+                (t for t in wanted if t not in matched and patterns[t].search(name)),
+                None
+            )
+            if param_type is None:
+                continue
+            
+            matched[param_type] = texture
+            emoji = "🏔️" if param_type == "Height" else "✅"
+            unreal.log(f"{emoji} Matched '{texture.get_name()}' → {param_type}")
         
         # Handle texture variation height map for standard materials
         if include_variation and "Height" not in matched and "Height" in patterns:
             # Look for any height-like texture that could be used for variation
-            for texture in textures:
-                name = texture.get_name().lower()
+            for texture, name in named_textures:
                 if patterns["Height"].search(name) and texture not in matched.values():
                     matched["VariationHeightMap"] = texture
                     unreal.log(f"🎲 Matched '{texture.get_name()}' → VariationHeightMap")
@@ -179,8 +193,8 @@ def _match_textures(textures, include_height=False, is_environment=False, includ
     
     return matched
 
-def _match_environment_textures(textures, patterns, include_variation=False):
-    """Match textures for environment materials (A/B sets + blend mask + variation)"""
+def _match_environment_textures(named_textures, patterns, include_variation=False):
+    """Match (texture, lowercase name) pairs for environment materials (A/B sets + blend mask + variation)"""
     matched = {}
     
     # Environment patterns
@@ -197,9 +211,7 @@ def _match_environment_textures(textures, patterns, include_variation=False):
     }
     
     # First pass: explicit A/B markers
-    for texture in textures:
-        name = texture.get_name().lower()
-        
+    for texture, name in named_textures:
         for param, pattern in env_patterns.items():
             if param in matched:
                 continue
@@ -221,11 +233,10 @@ def _match_environment_textures(textures, patterns, include_variation=False):
                 unreal.log(f"🌍 Matched '{texture.get_name()}' → {param}")
     
     # Second pass: assign remaining textures to A first, then B
-    for texture in textures:
+    for texture, name in named_textures:
         if texture in matched.values():
             continue
             
-        name = texture.get_name().lower()
         for base_type in ["Color", "Normal", "Roughness", "Metallic"]:
             if base_type in patterns and patterns[base_type].search(name):
                 param_a = f"{base_type}A"
@@ -243,11 +254,10 @@ def _match_environment_textures(textures, patterns, include_variation=False):
     # Handle texture variation for environment materials
     if include_variation:
         # Look for height textures that haven't been matched yet
-        for texture in textures:
+        for texture, name in named_textures:
             if texture in matched.values():
                 continue
             
-            name = texture.get_name().lower()
             if patterns["Height"].search(name):
                 matched["VariationHeightMap"] = texture
                 unreal.log(f"🎲 Environment matched '{texture.get_name()}' → VariationHeightMap")
@@ -258,12 +268,11 @@ def _match_environment_textures(textures, patterns, include_variation=False):
 def _apply_textures(instance, matched_textures):
     """Apply matched textures to material instance"""
     applied_count = 0
+    set_texture = unreal.MaterialEditingLibrary.set_material_instance_texture_parameter_value
     
     for param_name, texture in matched_textures.items():
         try:
-            unreal.MaterialEditingLibrary.set_material_instance_texture_parameter_value(
-                instance, param_name, texture
-            )
+            set_texture(instance, param_name, texture)
             
             # Emoji based on parameter type
             if param_name == "Height":
@@ -14,6 +14,40 @@ from PySide6.QtGui import *
 # Global widget reference for hot reloading
 material_editor_widget = None
 
+# Selected actor type -> mesh component that carries its material slots
+MESH_COMPONENT_CLASSES = (
+    (unreal.StaticMeshActor, unreal.StaticMeshComponent),
+    (unreal.SkeletalMeshActor, unreal.SkeletalMeshComponent),
+)
+
+# Parameter conflict rules - checked in order, first hit wins.
+# A rule fires when the parameter name contains one of param_words AND either the
+# parent material name contains one of material_words or it has texture_param.
+PARAM_CONFLICTS = {
+    "triplanar_uv": {
+        "param_words": ("scale", "tiling", "uvscale"),
+        "material_words": ("triplanar", "worldaligned"),
+        "title": "Triplanar vs UV Conflict",
+        "text": (
+            "'{param}' conflicts with triplanar mapping!\n\n"
+            "Triplanar materials use world-space coordinates and ignore UV scaling.\n"
+            "This parameter won't have any visible effect.\n\n"
+            "💡 Use either triplanar OR UV controls, not both."
+        ),
+    },
+    "texture_variation_manual": {
+        "param_words": ("scale", "tiling", "uvscale", "offset"),
+        "texture_param": "VariationHeightMap",
+        "title": "Texture Variation Conflict",
+        "text": (
+            "'{param}' may conflict with texture variation!\n\n"
+            "Texture variation automatically modifies UVs for randomness.\n"
+            "Manual UV adjustments might interfere with the variation effect.\n\n"
+            "💡 Disable texture variation if you need precise UV control."
+        ),
+    },
+}
+
 class DragValueBox(QWidget):
     """Custom drag-value box with progress bar fill"""
     value_changed = Signal(float)
@@ -369,6 +403,10 @@ class ParameterSlider(QWidget):
         
     def set_value(self, value):
         self.value_box.set_value(value)
+    
+    def value(self):
+        """Value currently shown in the box"""
+        return self.value_box.current_val
         
     def reset_to_original(self):
         """Reset to the value when parameter was first loaded"""
@@ -603,6 +641,9 @@ class MaterialInstanceEditor(QWidget):
         self.sections = {}
         self.is_master_material = False
         self.master_warnings_disabled = set()
+        self.acknowledged_conflicts = set()  # (material, param, conflict) already accepted
+        self.ignore_param_changes = False    # Set while a modal dialog or reset is running
+        self.active_dialog = None
 
         self.setWindowFlags(Qt.Window | Qt.WindowStaysOnTopHint)
 
@@ -802,8 +843,8 @@ class MaterialInstanceEditor(QWidget):
         else:
             return 0.0, 2.0
     
-    def show_master_material_confirmation(self, param_name, new_value):
-        """Show confirmation before changing master material"""
+    def show_master_material_confirmation(self, param_name, new_value, callback):
+        """Ask before changing master material - callback(result) runs when the dialog closes"""
         msg = QMessageBox()
         msg.setWindowTitle("AutoMatty - Master Material Warning")
         msg.setIcon(QMessageBox.Warning)
@@ -823,49 +864,69 @@ class MaterialInstanceEditor(QWidget):
         proceed_btn = msg.addButton("Proceed (Master)", QMessageBox.DestructiveRole)
         cancel_btn = msg.addButton("Cancel", QMessageBox.RejectRole)
         
-        msg.exec_()
-        
-        result = {
-            'action': 'cancel',
-            'dont_ask': dont_ask_checkbox.isChecked()
-        }
-        
-        if msg.clickedButton() == create_instance_btn:
-            result['action'] = 'create_instance'
-        elif msg.clickedButton() == proceed_btn:
-            result['action'] = 'proceed'
+        def on_finished():
+            result = {
+                'action': 'cancel',
+                'dont_ask': dont_ask_checkbox.isChecked()
+            }
+            
+            if msg.clickedButton() == create_instance_btn:
+                result['action'] = 'create_instance'
+            elif msg.clickedButton() == proceed_btn:
+                result['action'] = 'proceed'
+            
+            callback(result)
         
-        return result
+        self.open_dialog(msg, on_finished)
     
-    def show_conflict_warning(self, param_name, conflict_type):
-        """Show conflict warnings for incompatible parameter changes"""
+    def show_conflict_warning(self, param_name, conflict_type, callback):
+        """Warn about incompatible parameter changes - callback(proceed) runs when the dialog closes"""
         msg = QMessageBox()
         msg.setWindowTitle("AutoMatty - Parameter Conflict")
         msg.setIcon(QMessageBox.Warning)
         
-        if conflict_type == "triplanar_uv":
-            msg.setText("Triplanar vs UV Conflict")
-            msg.setInformativeText(
-                f"'{param_name}' conflicts with triplanar mapping!\n\n"
-                "Triplanar materials use world-space coordinates and ignore UV scaling.\n"
-                "This parameter won't have any visible effect.\n\n"
-                "💡 Use either triplanar OR UV controls, not both."
-            )
-        elif conflict_type == "texture_variation_manual":
-            msg.setText("Texture Variation Conflict") 
-            msg.setInformativeText(
-                f"'{param_name}' may conflict with texture variation!\n\n"
-                "Texture variation automatically modifies UVs for randomness.\n"
-                "Manual UV adjustments might interfere with the variation effect.\n\n"
-                "💡 Disable texture variation if you need precise UV control."
-            )
+        conflict = PARAM_CONFLICTS.get(conflict_type)
+        if conflict:
+            msg.setText(conflict["title"])
+            msg.setInformativeText(conflict["text"].format(param=param_name))
         
         proceed_btn = msg.addButton("Proceed Anyway", QMessageBox.AcceptRole)
         cancel_btn = msg.addButton("Cancel Change", QMessageBox.RejectRole)
         
-        msg.exec_()
-        
-        return msg.clickedButton() == proceed_btn
+        self.open_dialog(msg, lambda: callback(msg.clickedButton() == proceed_btn))
+    
+    def open_dialog(self, msg, on_finished):
+        """Show a modal dialog without a nested event loop so the editor keeps ticking.
+        Slider changes arriving while it is open are dropped, not stacked"""
+        self.ignore_param_changes = True
+        self.active_dialog = msg  # Keep the Python wrapper alive until it closes
+        
+        def finished(_result):
+            self.ignore_param_changes = False
+            self.active_dialog = None
+            msg.deleteLater()
+            on_finished()
+        
+        msg.finished.connect(finished)
+        msg.setWindowModality(Qt.ApplicationModal)
+        msg.show()
+    
+    def reset_slider(self, param_name):
+        """Put a slider back to its loaded value without re-triggering the checks"""
+        widget = self.parameter_widgets.get(param_name)
+        if widget and isinstance(widget, ParameterSlider):
+            self.ignore_param_changes = True
+            try:
+                widget.reset_to_original()
+            finally:
+                self.ignore_param_changes = False
+    
+    def current_slider_value(self, param_name, fallback):
+        """Value the slider shows now - it may have moved while a dialog was open"""
+        widget = self.parameter_widgets.get(param_name)
+        if widget and isinstance(widget, ParameterSlider):
+            return widget.value()
+        return fallback
     
     def detect_parameter_conflicts(self, param_name):
         """Detect potential conflicts with current parameter"""
@@ -884,23 +945,24 @@ class MaterialInstanceEditor(QWidget):
         if not parent_material:
             return None
             
-        # Check material for triplanar indicators (world-aligned functions)
         material_name = parent_material.get_name().lower()
+        texture_params = None  # Fetched at most once, only if a rule needs it
         
-        # UV scale conflicts with triplanar
-        if any(word in param_lower for word in ['scale', 'tiling', 'uvscale']):
-            if 'triplanar' in material_name or 'worldaligned' in material_name:
-                return "triplanar_uv"
-                
-        # UV adjustments might conflict with texture variation
-        if any(word in param_lower for word in ['scale', 'tiling', 'uvscale', 'offset']):
-            # Check if material has variation parameters
-            try:
-                texture_params = unreal.MaterialEditingLibrary.get_texture_parameter_names(parent_material)
-                if "VariationHeightMap" in texture_params:
-                    return "texture_variation_manual"
-            except:
-                pass
+        for conflict_type, rule in PARAM_CONFLICTS.items():
+            if not any(word in param_lower for word in rule["param_words"]):
+                continue
+            
+            if any(word in material_name for word in rule.get("material_words", ())):
+                return conflict_type
+            
+            if "texture_param" in rule:
+                if texture_params is None:
+                    try:
+                        texture_params = unreal.MaterialEditingLibrary.get_texture_parameter_names(parent_material)
+                    except Exception:
+                        texture_params = []
+                if rule["texture_param"] in texture_params:
+                    return conflict_type
                 
         return None
     
@@ -1199,31 +1261,39 @@ class MaterialInstanceEditor(QWidget):
     
     def on_scalar_parameter_changed(self, param_name, value):
         """Handle parameter changes with master material protection and conflict detection"""
-        if not self.current_instance:
+        if not self.current_instance or self.ignore_param_changes:
             return
         
-        # Check for parameter conflicts first
+        # Check for parameter conflicts first - ask once per material/parameter
         conflict_type = self.detect_parameter_conflicts(param_name)
         if conflict_type:
-            if not self.show_conflict_warning(param_name, conflict_type):
-                # User cancelled - reset parameter
-                widget = self.parameter_widgets.get(param_name)
-                if widget and isinstance(widget, ParameterSlider):
-                    widget.reset_to_original()
+            conflict_key = (self.current_instance.get_name(), param_name, conflict_type)
+            if conflict_key not in self.acknowledged_conflicts:
+                def on_conflict_answer(proceed):
+                    if not proceed:
+                        # User cancelled - reset parameter
+                        self.reset_slider(param_name)
+                        return
+                    self.acknowledged_conflicts.add(conflict_key)
+                    self.confirm_and_apply(param_name, self.current_slider_value(param_name, value))
+                
+                self.show_conflict_warning(param_name, conflict_type, on_conflict_answer)
                 return
         
+        self.confirm_and_apply(param_name, value)
+    
+    def confirm_and_apply(self, param_name, value):
+        """Apply a scalar change, asking first when it would edit a master material"""
+        if not self.current_instance:
+            return
+        material_name = self.current_instance.get_name()
+        
         # Check if this is a master material and we need confirmation
-        if self.is_master_material:
-            material_name = self.current_instance.get_name()
-            if material_name not in self.master_warnings_disabled:
-                
-                result = self.show_master_material_confirmation(param_name, value)
-                
+        if self.is_master_material and material_name not in self.master_warnings_disabled:
+            def on_master_answer(result):
                 if result['action'] == 'cancel':
                     # Reset the slider/input to previous value
-                    widget = self.parameter_widgets.get(param_name)
-                    if widget and isinstance(widget, ParameterSlider):
-                        widget.reset_to_original()
+                    self.reset_slider(param_name)
                     return
                 
                 elif result['action'] == 'create_instance':
@@ -1234,6 +1304,11 @@ class MaterialInstanceEditor(QWidget):
                 # Remember "don't ask" preference
                 if result['dont_ask']:
                     self.master_warnings_disabled.add(material_name)
+                
+                self.apply_parameter_change(param_name, self.current_slider_value(param_name, value))
+            
+            self.show_master_material_confirmation(param_name, value, on_master_answer)
+            return
         
         # Proceed with the change
         self.apply_parameter_change(param_name, value)
@@ -1289,29 +1364,20 @@ class MaterialInstanceEditor(QWidget):
 
             # Replace master material on all actors in current selection
             replaced_count = 0
-            for mat_info in self.current_materials:
-                if mat_info['instance'] == base_material:
-                    # This is the master material - replace it
+            master_slots = {
+                mat_info['slot'] for mat_info in self.current_materials
+                if mat_info['instance'] == base_material
+            }
+            if master_slots:
+                # One pass over the selection, checking every slot the master was seen in
+                for actor, mesh_component in get_selected_mesh_components():
                     try:
-                        # Find the actor and component
-                        editor_actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
-                        selected_actors = editor_actor_subsystem.get_selected_level_actors()
-
-                        for actor in selected_actors:
-                            if isinstance(actor, (unreal.StaticMeshActor, unreal.SkeletalMeshActor)):
-                                if isinstance(actor, unreal.StaticMeshActor):
-                                    mesh_component = actor.get_component_by_class(unreal.StaticMeshComponent)
-                                else:
-                                    mesh_component = actor.get_component_by_class(unreal.SkeletalMeshComponent)
-
-                                if mesh_component:
-                                    # Check if this slot has the master material
-                                    slot_index = mat_info['slot']
-                                    current_mat = mesh_component.get_material(slot_index)
-                                    if current_mat == base_material:
-                                        mesh_component.set_material(slot_index, new_instance)
-                                        replaced_count += 1
-                                        unreal.log(f"✅ Replaced master on {actor.get_name()} slot {slot_index}")
+                        for slot_index in sorted(master_slots):
+                            current_mat = mesh_component.get_material(slot_index)
+                            if current_mat == base_material:
+                                mesh_component.set_material(slot_index, new_instance)
+                                replaced_count += 1
+                                unreal.log(f"✅ Replaced master on {actor.get_name()} slot {slot_index}")
                     except Exception as e:
                         unreal.log_warning(f"⚠️ Failed to replace on actor: {e}")
 
@@ -1683,51 +1749,51 @@ class MaterialInstanceEditor(QWidget):
 # UE INTEGRATION FUNCTIONS
 # ========================================
 
-def get_selected_mesh_materials():
-    """Get ALL materials (both instances and masters) from selected mesh"""
+def get_selected_mesh_components():
+    """Yield (actor, mesh component) for each selected static/skeletal mesh actor"""
     editor_actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
-    selected_actors = editor_actor_subsystem.get_selected_level_actors()
     
+    for actor in editor_actor_subsystem.get_selected_level_actors():
+        # isinstance, not type() lookup - Blueprint subclasses of these actors count too
+        component_class = next(
+            (comp for actor_class, comp in MESH_COMPONENT_CLASSES if isinstance(actor, actor_class)),
+            None
+        )
+        if component_class is None:
+            continue
+        
+        mesh_component = actor.get_component_by_class(component_class)
+        if mesh_component:
+            yield actor, mesh_component
+
+def get_selected_mesh_materials():
+    """Get ALL materials (both instances and masters) from selected mesh"""
     material_instances = []
     
-    for actor in selected_actors:
-        if isinstance(actor, (unreal.StaticMeshActor, unreal.SkeletalMeshActor)):
-            mesh_component = None
-            mesh_asset_name = "Unknown"
-            
-            if isinstance(actor, unreal.StaticMeshActor):
-                mesh_component = actor.get_component_by_class(unreal.StaticMeshComponent)
-                if mesh_component:
-                    static_mesh = mesh_component.static_mesh
-                    if static_mesh:
-                        mesh_asset_name = static_mesh.get_name()
-            else:
-                mesh_component = actor.get_component_by_class(unreal.SkeletalMeshComponent)
-                if mesh_component:
-                    skeletal_mesh = mesh_component.skeletal_mesh
-                    if skeletal_mesh:
-                        mesh_asset_name = skeletal_mesh.get_name()
+    for actor, mesh_component in get_selected_mesh_components():
+        if isinstance(mesh_component, unreal.StaticMeshComponent):
+            mesh_asset = mesh_component.static_mesh
+        else:
+            mesh_asset = mesh_component.skeletal_mesh
+        mesh_asset_name = mesh_asset.get_name() if mesh_asset else "Unknown"
+        
+        # Create a display name that shows the asset name and instance info
+        actor_display_name = f"{mesh_asset_name} (instance)"
+        
+        for i in range(mesh_component.get_num_materials()):
+            material = mesh_component.get_material(i)
             
-            if mesh_component:
-                num_materials = mesh_component.get_num_materials()
+            # Accept both Materials and Material Instances
+            if isinstance(material, (unreal.MaterialInstanceConstant, unreal.Material)):
+                material_type = "Master" if isinstance(material, unreal.Material) else "Instance"
                 
-                # Create a display name that shows the asset name and instance info
-                actor_display_name = f"{mesh_asset_name} (instance)"
-                
-                for i in range(num_materials):
-                    material = mesh_component.get_material(i)
-                    
-                    # Accept both Materials and Material Instances
-                    if isinstance(material, (unreal.MaterialInstanceConstant, unreal.Material)):
-                        material_type = "Master" if isinstance(material, unreal.Material) else "Instance"
-                        
-                        material_instances.append({
-                            'name': material.get_name(),
-                            'instance': material,
-                            'slot': i,
-                            'actor': actor_display_name,
-                            'type': material_type
-                        })
+                material_instances.append({
+                    'name': material.get_name(),
+                    'instance': material,
+                    'slot': i,
+                    'actor': actor_display_name,
+                    'type': material_type
+                })
     
     return material_instances
 
@@ -1776,9 +1842,3 @@ def reload_material_editor():
     except Exception as e:
         unreal.log_error(f"❌ Reload failed: {e}")
         return None
-
-def show_material_editor():
-    """Show the material editor with current selection (with hot reload)"""
-    editor_module = reload_material_editor()
-    if editor_module:
-        editor_module.show_editor_for_selection()
\ No newline at end of file
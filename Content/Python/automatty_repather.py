@@ -2,9 +2,13 @@
 AutoMatty Texture Repather with Texture Variation Support - Smart texture replacement in material instances
 """
 import unreal
+import re
 from automatty_config import AutoMattyConfig
 from automatty_utils import AutoMattyUtils
 
+# Trailing version tag (_v001, _v2, ...) - ignored when matching
+_VERSION_SUFFIX_RE = re.compile(r'_v\d+$')
+
 
 def repath_material_instances():
     """
@@ -57,12 +61,15 @@ def repath_material_instances():
     # 4) Remap each instance
     total_remapped = 0
     for instance in instances:
-        unreal.log(f"🔧 Processing {instance.get_name()}...")
+        # Per-instance report - emitted as one log call (and one warning call) per instance
+        log_lines = [f"🔧 Processing {instance.get_name()}..."]
+        warning_lines = []
         
         # Get the parent material
         parent_material = instance.get_editor_property('parent')
         
         if not parent_material:
+            unreal.log("\n".join(log_lines))
             unreal.log_warning(f"  ⚠️ No parent material found for {instance.get_name()}")
             continue
         
@@ -94,10 +101,14 @@ def repath_material_instances():
                     else:
                         param_emoji = "✅"
                     
-                    unreal.log(f"  {param_emoji} {param_name}: {current_texture.get_name()} → {new_texture.get_name()}")
+                    log_lines.append(f"  {param_emoji} {param_name}: {current_texture.get_name()} → {new_texture.get_name()}")
                     remapped_count += 1
                 else:
-                    unreal.log_warning(f"  ⚠️ No match for {param_name}: {current_texture.get_name()}")
+                    warning_lines.append(f"  ⚠️ No match for {param_name}: {current_texture.get_name()}")
+        
+        unreal.log("\n".join(log_lines))
+        if warning_lines:
+            unreal.log_warning("\n".join(warning_lines))
         
         if remapped_count > 0:
             unreal.EditorAssetLibrary.save_asset(instance.get_path_name())
@@ -107,7 +118,6 @@ def repath_material_instances():
 
 def find_best_match(current_texture, target_textures, param_name=None):
     """Smart texture matching with multiple strategies including texture variation support"""
-    import re
     current_name = current_texture.get_name().lower()
     
     # 1. Exact match
@@ -116,9 +126,9 @@ def find_best_match(current_texture, target_textures, param_name=None):
             return tex
     
     # 2. Version-agnostic match (remove _v001, _v002, etc.)
-    clean_current = re.sub(r'_v\d+$', '', current_name)
+    clean_current = _VERSION_SUFFIX_RE.sub('', current_name)
     for tex in target_textures:
-        clean_target = re.sub(r'_v\d+$', '', tex.get_name().lower())
+        clean_target = _VERSION_SUFFIX_RE.sub('', tex.get_name().lower())
         if clean_target == clean_current:
             return tex
     
@@ -140,17 +150,13 @@ def find_best_match(current_texture, target_textures, param_name=None):
                     return tex
     
     # 4. Fallback to general type matching
-    current_type = None
-    for tex_type, pattern in patterns.items():
-        if pattern.search(current_name):
-            current_type = tex_type
-            break
+    current_type = AutoMattyConfig.classify_texture(current_name)
     
     if current_type:
+        pattern = patterns[current_type]
         for tex in target_textures:
-            for tex_type, pattern in patterns.items():
-                if tex_type == current_type and pattern.search(tex.get_name().lower()):
-                    return tex
+            if pattern.search(tex.get_name().lower()):
+                return tex
     
     return None
 
@@ -174,13 +180,7 @@ def repath_material_instances_from_folder():
     target_folder = AutoMattyConfig.get_custom_texture_path()
     
     # 3) Get all textures from the target folder
-    asset_paths = unreal.EditorAssetLibrary.list_assets(target_folder, recursive=False)
-    target_textures = []
-    
-    for asset_path in asset_paths:
-        asset = unreal.EditorAssetLibrary.load_asset(asset_path)
-        if isinstance(asset, unreal.Texture2D):
-            target_textures.append(asset)
+    target_textures = AutoMattyUtils.get_textures_in_folder(target_folder)
     
     if not target_textures:
         unreal.log_error(f"❌ No textures found in {target_folder}")
@@ -200,11 +200,14 @@ def repath_material_instances_from_folder():
     # 4) Remap each instance (same logic as main function)
     total_remapped = 0
     for instance in instances:
-        unreal.log(f"🔧 Processing {instance.get_name()}...")
+        # Per-instance report - emitted as one log call (and one warning call) per instance
+        log_lines = [f"🔧 Processing {instance.get_name()}..."]
+        warning_lines = []
         
         parent_material = instance.get_editor_property('parent')
         
         if not parent_material:
+            unreal.log("\n".join(log_lines))
             unreal.log_warning(f"  ⚠️ No parent material found for {instance.get_name()}")
             continue
         
@@ -231,10 +234,14 @@ def repath_material_instances_from_folder():
                     else:
                         param_emoji = "✅"
                     
-                    unreal.log(f"  {param_emoji} {param_name}: {current_texture.get_name()} → {new_texture.get_name()}")
+                    log_lines.append(f"  {param_emoji} {param_name}: {current_texture.get_name()} → {new_texture.get_name()}")
                     remapped_count += 1
                 else:
-                    unreal.log_warning(f"  ⚠️ No match for {param_name}: {current_texture.get_name()}")
+                    warning_lines.append(f"  ⚠️ No match for {param_name}: {current_texture.get_name()}")
+        
+        unreal.log("\n".join(log_lines))
+        if warning_lines:
+            unreal.log_warning("\n".join(warning_lines))
         
         if remapped_count > 0:
             unreal.EditorAssetLibrary.save_asset(instance.get_path_name())
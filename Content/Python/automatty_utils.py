@@ -4,6 +4,7 @@ No path discovery needed - UE handles it automatically!
 """
 import unreal
 import re
+from functools import lru_cache
 from automatty_config import AutoMattyConfig
 
 # That's it! No complex path discovery needed.
@@ -22,6 +23,66 @@ def log_plugin_info():
     unreal.log("🔌 AutoMatty using UE5 native Python plugin architecture")
     unreal.log("📁 Scripts auto-loaded from Plugin/Content/Python/")
 
+# Texture-name suffixes stripped by extract_material_base_name (longest first)
+_TEXTURE_TYPES = sorted([
+    "color", "colour", "albedo", "diffuse", "basecolor", "base_color",
+    "normal", "norm", "nrm", "bump", "roughness", "rough", "gloss",
+    "metallic", "metalness", "metal", "specular", "spec",
+    "occlusion", "ao", "ambient_occlusion", "orm", "rma", "mas",
+    "height", "displacement", "disp", "emission", "emissive", "glow",
+    "blend", "mask", "mix",
+], key=len, reverse=True)
+
+# Precompiled base-name cleanup patterns - three passes, each merging
+# steps that cannot create or hide matches for one another:
+#   1. file extension, UDIM tile and colorspace tags
+#   2. texture-type suffix (to end of name) or trailing resolution
+#   3. version number plus any trailing underscores
+_TAGS_RE = re.compile(
+    r"\.(?:jpg|png|tga|exr|hdr|tiff)$"
+    r"|_(?:10\d{2}|<udim>)"
+    # colorspace tag, possibly only reachable once UDIM tags before it are gone
+    r"|_(?:_(?:10\d{2}|<udim>))*(?:srgb|linear|rec709|aces)",
+    re.IGNORECASE
+)
+_SUFFIX_RE = re.compile(
+    r"_(?:" + "|".join(_TEXTURE_TYPES) + r")(?:_.*)?$|_(?:\d+k|\d{3,4})$",
+    re.IGNORECASE
+)
+_TAIL_RE = re.compile(r"(?:_v?\d+)?_*$")
+_SPLIT_RE = re.compile(r"[_\-\.]")
+_ALPHA_START_RE = re.compile(r"^[a-zA-Z]")
+
+class TextureAssetRef:
+    """Unloaded registry entry that answers get_name() like a Texture2D - load() fetches the asset"""
+
+    def __init__(self, asset_data):
+        self.asset_data = asset_data
+        self._name = str(asset_data.asset_name)
+
+    def get_name(self):
+        return self._name
+
+    def load(self):
+        texture = self.asset_data.get_asset()
+        return texture if isinstance(texture, unreal.Texture2D) else None
+
+@lru_cache(maxsize=256)
+def _base_name_from_texture(first_texture):
+    """Material base name for a texture name - cached, a texture set repeats across a batch"""
+    base_name = _TAGS_RE.sub("", first_texture)
+    base_name = _SUFFIX_RE.sub("", base_name)
+    base_name = _TAIL_RE.sub("", base_name, count=1)
+
+    if not base_name or len(base_name) < 2:
+        fallback = _SPLIT_RE.split(first_texture)[0]
+        base_name = fallback if fallback else "Material"
+
+    if not _ALPHA_START_RE.match(base_name):
+        base_name = f"Mat_{base_name}"
+
+    return base_name
+
 # Basic validation functions
 def validate_unreal_path(path):
     """Validate that a path starts with /Game/ or /Engine/"""
@@ -46,12 +107,48 @@ def ensure_game_path(path):
 class AutoMattyUtils:
     """Helper utilities used across the plugin"""
 
+    # Substrate probe result - project setting needs an editor restart to change
+    _substrate_cache = None
+
     @staticmethod
     def is_substrate_enabled():
+        if AutoMattyUtils._substrate_cache is None:
+            AutoMattyUtils._substrate_cache = AutoMattyUtils._probe_substrate()
+        return AutoMattyUtils._substrate_cache
+
+    @staticmethod
+    def reset_substrate_cache():
+        """Force the next is_substrate_enabled call to re-probe"""
+        AutoMattyUtils._substrate_cache = None
+
+    @staticmethod
+    def invalidate_caches():
+        """Drop every per-session probe (Substrate, default normal) - next calls look again"""
+        AutoMattyUtils.reset_substrate_cache()
+        AutoMattyUtils._default_normal_cache = None
+        AutoMattyUtils._default_normal_searched = False
+
+    @staticmethod
+    def _probe_substrate():
+        """Class + CVar check - the throwaway-node probe only when the CVar isn't there"""
+        if not hasattr(unreal, "MaterialExpressionSubstrateSlabBSDF"):
+            return False
+        try:
+            # String read tells "missing" ('') apart from "off" ('0') - the int read returns 0 for both
+            value = unreal.SystemLibrary.get_console_variable_string_value("r.Substrate")
+        except Exception:
+            value = ""
+        value = value.strip().lower()
+        if value:
+            return value not in ("0", "false")
+        return AutoMattyUtils._probe_substrate_node()
+
+    @staticmethod
+    def _probe_substrate_node():
+        """Fallback probe - can a Substrate slab node be created at all"""
         try:
             temp_mat = unreal.Material()
-            lib = unreal.MaterialEditingLibrary
-            temp_node = lib.create_material_expression(
+            temp_node = unreal.MaterialEditingLibrary.create_material_expression(
                 temp_mat, unreal.MaterialExpressionSubstrateSlabBSDF, 0, 0
             )
             return temp_node is not None
@@ -59,42 +156,92 @@ class AutoMattyUtils:
             return True
 
     @staticmethod
-    def get_next_asset_name(base_name, folder, prefix="v", pad=3):
+    def _get_folder_asset_names(folder):
         registry = unreal.AssetRegistryHelpers.get_asset_registry()
-        assets = registry.get_assets_by_path(folder, recursive=False)
-        pat = re.compile(rf"^{re.escape(base_name)}_{prefix}(\d{{{pad}}})$")
-        max_idx = 0
-        for ad in assets:
-            m = pat.match(str(ad.asset_name))
-            if m and int(m.group(1)) > max_idx:
-                max_idx = int(m.group(1))
+        return [str(ad.asset_name) for ad in registry.get_assets_by_path(folder, recursive=False)]
+
+    @staticmethod
+    def get_next_asset_name(base_name, folder, prefix="v", pad=3, names=None):
+        # Plain string checks instead of a regex per asset - most names fail startswith
+        head = f"{base_name}_{prefix}"
+        full_len = len(head) + pad
+        if names is None:
+            names = AutoMattyUtils._get_folder_asset_names(folder)
+        max_idx = max(
+            (int(name[-pad:]) for name in names
+             if len(name) == full_len and name.startswith(head) and name[-pad:].isdecimal()),
+            default=0
+        )
         return f"{base_name}_{prefix}{max_idx+1:0{pad}d}"
     
+    @staticmethod
+    def get_texture_refs_in_folder(folder):
+        """Texture2D registry entries directly in folder as TextureAssetRefs - nothing is loaded"""
+        registry = unreal.AssetRegistryHelpers.get_asset_registry()
+        ar_filter = unreal.ARFilter(
+            package_paths=[folder.rstrip("/")],
+            recursive_paths=False,
+            class_paths=[unreal.TopLevelAssetPath("/Script/Engine", "Texture2D")]
+        )
+        return [TextureAssetRef(asset_data) for asset_data in registry.get_assets(ar_filter)]
+
+    @staticmethod
+    def get_textures_in_folder(folder):
+        """Texture2D assets directly in folder - registry-filtered, nothing else gets loaded"""
+        textures = []
+        for ref in AutoMattyUtils.get_texture_refs_in_folder(folder):
+            texture = ref.load()
+            if texture:
+                textures.append(texture)
+        return textures
+
+    # Default normal lookup result - engine textures never move, so search once
+    _default_normal_cache = None
+    _default_normal_searched = False
+
     @staticmethod
     def find_default_normal():
-        """Find default normal texture - FIXED VERSION"""
+        """Find default normal texture (memoized)"""
+        if not AutoMattyUtils._default_normal_searched:
+            AutoMattyUtils._default_normal_cache = AutoMattyUtils._search_default_normal()
+            AutoMattyUtils._default_normal_searched = True
+        return AutoMattyUtils._default_normal_cache
+
+    @staticmethod
+    def _search_default_normal():
+        """Locate the engine default normal - direct paths, then a one-time walk"""
         # Try direct path first (most reliable)
         direct_paths = [
+            "/Engine/EngineResources/DefaultTextures/DefaultNormal",
             "/Engine/EngineMaterials/DefaultNormal",
-            "/Engine/EngineResources/DefaultTextures/DefaultNormal", 
             "/Engine/EngineResources/DefaultNormal"
         ]
 
         for path in direct_paths:
+            if not unreal.EditorAssetLibrary.does_asset_exist(path):
+                continue
             texture = unreal.EditorAssetLibrary.load_asset(path)
             if texture and isinstance(texture, unreal.Texture2D):
                 unreal.log(f"✅ Found default normal: {path}")
                 return texture
 
-        # Fallback: search method (if direct paths fail)
+        # Fallback: registry query limited to engine Texture2D assets (no loads, no full path list)
+        # - the engine resource folders first, the whole /Engine tree only if they miss
         try:
-            assets = unreal.EditorAssetLibrary.list_assets("/Engine", recursive=True, include_folder=False)
-            for path in assets:
-                if "defaultnormal" in path.lower() and not path.lower().endswith(".uasset"):
-                    texture = unreal.EditorAssetLibrary.load_asset(path) 
-                    if texture and isinstance(texture, unreal.Texture2D):
-                        unreal.log(f"✅ Found default normal (fallback): {path}")
-                        return texture
+            registry = unreal.AssetRegistryHelpers.get_asset_registry()
+            texture_class = unreal.TopLevelAssetPath("/Script/Engine", "Texture2D")
+            for package_paths in (["/Engine/EngineResources", "/Engine/EngineMaterials"], ["/Engine"]):
+                ar_filter = unreal.ARFilter(
+                    package_paths=package_paths,
+                    recursive_paths=True,
+                    class_paths=[texture_class]
+                )
+                for asset_data in registry.get_assets(ar_filter):
+                    if "defaultnormal" in str(asset_data.asset_name).lower():
+                        texture = asset_data.get_asset()
+                        if texture and isinstance(texture, unreal.Texture2D):
+                            unreal.log(f"✅ Found default normal (fallback): {asset_data.package_name}")
+                            return texture
         except Exception as e:
             unreal.log_warning(f"⚠️ Search fallback failed: {e}")
 
@@ -107,36 +254,7 @@ class AutoMattyUtils:
         if not textures:
             return "Material"
 
-        first_texture = textures[0].get_name()
-        base_name = first_texture
-
-        base_name = re.sub(r"\.(jpg|png|tga|exr|hdr|tiff)$", "", base_name, flags=re.IGNORECASE)
-        base_name = re.sub(r"_(?:10\d{2}|<udim>)", "", base_name, flags=re.IGNORECASE)
-        base_name = re.sub(r"_(?:srgb|linear|rec709|aces)", "", base_name, flags=re.IGNORECASE)
-        base_name = re.sub(r"_(?:\d+k|\d{3,4})$", "", base_name, flags=re.IGNORECASE)
-
-        texture_types = [
-            "color", "colour", "albedo", "diffuse", "basecolor", "base_color",
-            "normal", "norm", "nrm", "bump", "roughness", "rough", "gloss",
-            "metallic", "metalness", "metal", "specular", "spec",
-            "occlusion", "ao", "ambient_occlusion", "orm", "rma", "mas",
-            "height", "displacement", "disp", "emission", "emissive", "glow",
-            "blend", "mask", "mix",
-        ]
-
-        type_pattern = r"_(?:" + "|".join(texture_types) + r")(?:_.*)?$"
-        base_name = re.sub(type_pattern, "", base_name, flags=re.IGNORECASE)
-        base_name = re.sub(r"_+$", "", base_name)
-        base_name = re.sub(r"_v?\d+$", "", base_name)
-
-        if not base_name or len(base_name) < 2:
-            fallback = re.split(r"[_\-\.]", first_texture)[0]
-            base_name = fallback if fallback else "Material"
-
-        if not re.match(r"^[a-zA-Z]", base_name):
-            base_name = f"Mat_{base_name}"
-
-        return base_name
+        return _base_name_from_texture(textures[0].get_name())
 
     @staticmethod
     def generate_smart_instance_name(base_material, textures, custom_path=None):
@@ -145,10 +263,9 @@ class AutoMattyUtils:
 
         folder = custom_path or AutoMattyConfig.get_setting("material_path")
 
-        full_path = f"{folder}/{instance_name}"
-        if unreal.EditorAssetLibrary.does_asset_exist(full_path):
-            instance_name = AutoMattyUtils.get_next_asset_name(
-                f"M_{material_base}_Inst", folder
-            )
+        # One folder scan answers both "is the plain name free" and "next version"
+        names = AutoMattyUtils._get_folder_asset_names(folder)
+        if instance_name in names:
+            instance_name = AutoMattyUtils.get_next_asset_name(instance_name, folder, names=names)
 
         return instance_name, folder
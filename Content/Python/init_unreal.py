@@ -13,12 +13,10 @@ class AutoMattyMaterialEditor(unreal.ToolMenuEntryScript):
     def execute(self, context):
         """Execute when menu item is clicked"""
         try:
-            # Simple import - no path discovery needed!
-            import automatty_material_instance_editor
-            import importlib
-            importlib.reload(automatty_material_instance_editor)
-            automatty_material_instance_editor.show_editor_for_selection()
-            unreal.log("🎯 AutoMatty Material Editor opened!")
+            # Goes through the cached unreal_qt probe - Qt is only imported once it's known to work
+            import automatty_config
+            if automatty_config.show_material_editor():
+                unreal.log("🎯 AutoMatty Material Editor opened!")
         except Exception as e:
             unreal.log_error(f"❌ Failed to open AutoMatty editor: {e}")
 
@@ -30,24 +28,21 @@ class AutoMattyMainWidget(unreal.ToolMenuEntryScript):
     def execute(self, context):
         """Execute when menu item is clicked"""
         try:
-            # Open the main AutoMatty widget
-            subsystem = unreal.get_editor_subsystem(unreal.EditorUtilitySubsystem)
-            blueprint = unreal.EditorAssetLibrary.load_asset("/AutoMatty/Blueprints/EUW_AutoMatty")
-            
-            if blueprint:
-                widget = subsystem.spawn_and_register_tab(blueprint)
-                if widget:
-                    unreal.log("🎯 AutoMatty main widget opened!")
-                else:
-                    unreal.log_error("❌ Failed to spawn AutoMatty widget")
-            else:
-                unreal.log_error("❌ Could not load EUW_AutoMatty blueprint")
+            # Open the main AutoMatty widget - shared opener reuses the loaded blueprint
+            import automatty_config
+            automatty_config.open_main_widget()
                 
         except Exception as e:
             unreal.log_error(f"❌ Failed to open AutoMatty widget: {e}")
 
+# Registered Tools menu scripts - kept referenced, and a second call is a no-op
+_TOOLS_MENU_SCRIPTS = []
+
 def register_automatty_menus():
     """Register AutoMatty Tools menu entries - NO DUPLICATES"""
+    if _TOOLS_MENU_SCRIPTS:
+        return True
+    
     try:
         # Tools menu gets ONLY the main widget and material editor
         # Toolbar gets everything else
@@ -81,6 +76,7 @@ def register_automatty_menus():
             tool_tip="Open AutoMatty Material Instance Editor"
         )
         editor_script.register_menu_entry()
+        _TOOLS_MENU_SCRIPTS.extend([widget_script, editor_script])
         
         # Refresh menus
         menus.refresh_all_widgets()